@@ -4,9 +4,13 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 # modelos e ferramentas de ML
-from sklearn.ensemble import IsolationForest, RandomForestRegressor
+from sklearn.ensemble import IsolationForest
 from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import PolynomialFeatures
+from sklearn.neighbors import KDTree
+from sklearn.preprocessing import PolynomialFeatures, StandardScaler
+import joblib
+
+import modelos
 
 
 # FUNCAO 1: analisar a curva de carreira
@@ -84,10 +88,9 @@ def detectar_anomalias(df, nome_do_jogador):
     
     return anomalias_df[colunas_para_exibir], fig, None
 
-# FUNCAO 3: previsao de media de pontos na proxima temporada
-# objetivo: usar dados historicos de TODOS os jogadores para treinar o modelo e preve a média de pontos de um jogador na proxima temporada
-def prever_proxima_temporada(df, nome_do_jogador):
-    # agrupa os dados de TODOS os jogadores por temporada para criar uma base de dados de treino
+# FUNCAO AUXILIAR: agrupa os jogos de TODOS os jogadores por temporada
+# objetivo: base comum usada pela previsao de pontos e pelo indice de temporadas similares
+def agregar_temporadas(df):
     df_temporadas = df.groupby(['player_name', 'season_year', 'team_id']).agg(
         pts=('pts', 'mean'), min=('min', 'mean'), ast=('ast', 'mean'),
         reb=('reb', 'mean'), fg_pct=('fg_pct', 'mean'), fg3_pct=('fg3_pct', 'mean'),
@@ -104,25 +107,45 @@ def prever_proxima_temporada(df, nome_do_jogador):
 
     # `shift(-1)` "puxa" o dado da linha de baixo (próxima temporada) para a linha atual.
     df_temporadas['next_pts'] = df_temporadas.groupby('player_name')['pts'].shift(-1)
+    return df_temporadas
+
+# features usadas pelo modelo de previsao de pontos
+features_previsao_pontos = [
+    'pts', 'min', 'ast', 'reb', 'fg_pct', 'fg3_pct', 'ft_pct', 'tov', 
+    'total_jogos', 
+    'season_year_numeric',
+    'mudou_de_time', 
+    'tendencia_pts'
+]
+
+# FUNCAO AUXILIAR: base de treino da previsao de pontos
+# objetivo: manter apenas as temporadas que tem temporada anterior e seguinte, usada tambem pelo benchmark dos modelos
+def preparar_base_previsao_pontos(df_temporadas):
     df_modelo = df_temporadas.dropna(subset=['next_pts', 'time_anterior_id', 'pts_anterior']).copy()
     df_modelo['tendencia_pts'] = df_modelo['tendencia_pts'].fillna(0)
+    return df_modelo
 
-    # treinamento do modelo - define a lista de features que o modelo irá usar para fazer a previsao
-    features = [
-        'pts', 'min', 'ast', 'reb', 'fg_pct', 'fg3_pct', 'ft_pct', 'tov', 
-        'total_jogos', 
-        'season_year_numeric',
-        'mudou_de_time', 
-        'tendencia_pts'
-    ]
-    
+# FUNCAO AUXILIAR: treina o regressor da previsao de pontos
+# objetivo: separar o treino da previsao, assim o modelo treinado pode ser reaproveitado entre varias consultas
+def treinar_modelo_previsao_pontos(df, backend=modelos.backend_padrao):
+    # agrupa os dados de TODOS os jogadores por temporada para criar uma base de dados de treino
+    df_modelo = preparar_base_previsao_pontos(agregar_temporadas(df))
 
-    X = df_modelo[features] # treino
+    X = df_modelo[features_previsao_pontos] # treino
     y = df_modelo['next_pts'] # alvo do treino
 
-    
-    model = RandomForestRegressor(n_estimators=200, random_state=42, n_jobs=-1) # cria o modelo Random Forest Regressor
+    model = modelos.criar_modelo(backend, 'regressor') # cria o regressor do backend escolhido (padrao: Random Forest)
     model.fit(X, y) # treina o modelo com os dados historicos de todos os jogadores 
+    return model
+
+# FUNCAO 3: previsao de media de pontos na proxima temporada
+# objetivo: usar dados historicos de TODOS os jogadores para treinar o modelo e preve a média de pontos de um jogador na proxima temporada
+# se `model` for informado (ja treinado), o treino e pulado
+def prever_proxima_temporada(df, nome_do_jogador, backend=modelos.backend_padrao, model=None):
+    if model is None:
+        model = treinar_modelo_previsao_pontos(df, backend)
+
+    df_temporadas = agregar_temporadas(df)
     
     # pega os dados do jogador selecionado 
     dados_jogador = df_temporadas[df_temporadas['player_name'] == nome_do_jogador].copy()
@@ -136,7 +159,7 @@ def prever_proxima_temporada(df, nome_do_jogador):
     temporada_recente['tendencia_pts'] = temporada_recente['tendencia_pts'].fillna(0)
     
     # prepara os dados da ultima temporada para "alimentar" o modelo 
-    dados_para_previsao = temporada_recente[features]
+    dados_para_previsao = temporada_recente[features_previsao_pontos]
     previsao_pts = model.predict(dados_para_previsao)[0] # usa o modelo de treino para prever a media de pontos da proxima temporada
 
     # resultado da previsao 
@@ -147,4 +170,99 @@ def prever_proxima_temporada(df, nome_do_jogador):
         "pts_previstos": previsao_pts
     }
     
-    return resultado_previsao, None
\ No newline at end of file
+    return resultado_previsao, None
+
+# estatisticas usadas para comparar temporadas de jogadores diferentes
+features_similaridade = ['pts', 'min', 'ast', 'reb', 'fg_pct', 'fg3_pct', 'ft_pct', 'tov', 'total_jogos']
+arquivo_indice_similaridade = 'indice_similaridade.pkl'
+
+# FUNCAO AUXILIAR: uma linha por temporada de cada jogador
+# objetivo: jogadores trocados no meio da temporada tem uma linha por time em `agregar_temporadas`, aqui essas linhas sao unidas usando a media ponderada pelo numero de jogos
+def agregar_temporadas_completas(df):
+    df_temporadas = agregar_temporadas(df)
+    estatisticas = [f for f in features_similaridade if f != 'total_jogos']
+    df_temporadas[estatisticas] = df_temporadas[estatisticas].fillna(0).multiply(df_temporadas['total_jogos'], axis=0)
+
+    df_completas = df_temporadas.groupby(['player_name', 'season_year'])[estatisticas + ['total_jogos']].sum().reset_index()
+    df_completas[estatisticas] = df_completas[estatisticas].div(df_completas['total_jogos'], axis=0)
+
+    # `shift(-1)` pega a proxima temporada registrada do jogador, que so vale como "temporada seguinte" se for exatamente o ano seguinte
+    # (lesoes ou temporadas fora da NBA deixam buracos na carreira)
+    df_completas['season_year_numeric'] = df_completas['season_year'].str[:4].astype(int)
+    ano_seguinte = df_completas.groupby('player_name')['season_year_numeric'].shift(-1)
+    df_completas['next_pts'] = df_completas.groupby('player_name')['pts'].shift(-1)
+    df_completas.loc[ano_seguinte != df_completas['season_year_numeric'] + 1, 'next_pts'] = np.nan
+    return df_completas
+
+# identifica os dados usados para construir o indice, para saber quando ele precisa ser reconstruido
+def assinatura_indice(df):
+    return {
+        "registros": len(df),
+        "soma_pts": float(df['pts'].sum()),
+        "ultima_temporada": df['season_year'].max(),
+        "features": list(features_similaridade),
+        "formato": 2, # muda quando a estrutura do indice muda
+    }
+
+# FUNCAO 4: indice de temporadas similares
+# objetivo: padronizar as estatisticas de cada temporada e organiza-las em uma KD-Tree, assim a busca pelas temporadas mais parecidas nao precisa percorrer a base inteira
+def construir_indice_similaridade(df):
+    df_temporadas = agregar_temporadas_completas(df)
+
+    colunas = ['player_name', 'season_year'] + features_similaridade + ['next_pts']
+    df_temporadas = df_temporadas[colunas]
+
+    # apenas temporadas com resultado conhecido na temporada seguinte podem aparecer como similares
+    candidatas = df_temporadas.dropna(subset=['next_pts']).reset_index(drop=True)
+
+    scaler = StandardScaler() # padroniza as estatisticas para que pontos e minutos nao dominem as porcentagens
+    X = scaler.fit_transform(candidatas[features_similaridade])
+    arvore = KDTree(X) # estrutura de busca por vizinhos mais proximos
+
+    # todas as temporadas continuam no indice para poderem ser usadas como consulta
+    return {
+        "arvore": arvore, "scaler": scaler, "temporadas": df_temporadas, "candidatas": candidatas,
+        "assinatura": assinatura_indice(df)
+    }
+
+# verifica se o indice salvo foi construido a partir dos mesmos dados e features
+def indice_atualizado(indice, df):
+    return indice.get("assinatura") == assinatura_indice(df)
+
+# salva o indice em disco para nao precisar reconstrui-lo a cada execucao
+def salvar_indice_similaridade(indice, caminho=arquivo_indice_similaridade):
+    joblib.dump(indice, caminho)
+
+def carregar_indice_similaridade(caminho=arquivo_indice_similaridade):
+    try:
+        return joblib.load(caminho)
+    except FileNotFoundError:
+        return None
+
+# FUNCAO 5: busca das temporadas mais parecidas
+# objetivo: responder "quem teve uma temporada parecida com essa?" e mostrar a media de pontos que esses jogadores tiveram na temporada seguinte
+def buscar_temporadas_similares(indice, nome_do_jogador, temporada=None, k=5):
+    temporadas = indice["temporadas"]
+    dados_jogador = temporadas[temporadas['player_name'] == nome_do_jogador]
+    if dados_jogador.empty:
+        return None, f"Jogador '{nome_do_jogador}' não encontrado."
+
+    # sem temporada definida, usa a mais recente do jogador
+    if temporada is None:
+        temporada = dados_jogador['season_year'].max()
+    consulta = dados_jogador[dados_jogador['season_year'] == temporada]
+    if consulta.empty:
+        return None, f"Temporada {temporada} de '{nome_do_jogador}' não encontrada."
+
+    X_consulta = indice["scaler"].transform(consulta[features_similaridade])
+
+    # busca vizinhos extras para poder descartar as temporadas do proprio jogador
+    candidatas = indice["candidatas"]
+    n_vizinhos = min(k + len(dados_jogador), len(candidatas))
+    distancias, posicoes = indice["arvore"].query(X_consulta, k=n_vizinhos)
+
+    similares = candidatas.iloc[posicoes[0]].copy()
+    similares['distancia'] = distancias[0]
+    similares = similares[similares['player_name'] != nome_do_jogador].head(k)
+
+    return similares.reset_index(drop=True), None
@@ -24,6 +24,7 @@ st.markdown(
         - Visualize a curva de carreira de um jogador.
         - Veja quais foram os jogos mais anormais de um jogador.
         - Preveja a média de pontos para a próxima temporada de um jogador.
+        - Encontre as temporadas de outros jogadores mais parecidas com a de um jogador.
         
     - **2️⃣ Previsão de Jogos:**
         - Escolha dois times, veja qual time tem a maior probabilidade de vencer a partida.
@@ -0,0 +1,119 @@
+# bibliotecas para manipulação de dados
+import pandas as pd
+
+# modelos de ML disponiveis como backend
+from sklearn.ensemble import (
+    HistGradientBoostingClassifier, HistGradientBoostingRegressor,
+    RandomForestClassifier, RandomForestRegressor
+)
+from sklearn.linear_model import LinearRegression, LogisticRegression
+
+
+# backends disponiveis para os modelos do projeto
+# cada backend sabe criar um classificador (previsao de jogos), um regressor (previsao de pontos)
+# e define a grade de parametros usada pelo GridSearchCV no treinamento do classificador
+backends = {
+    'randomforest': {
+        'nome': 'Random Forest',
+        'classificador': lambda: RandomForestClassifier(random_state=42),
+        'regressor': lambda: RandomForestRegressor(n_estimators=200, random_state=42, n_jobs=-1),
+        'param_grid': {
+            'n_estimators': [100, 200],
+            'max_depth': [10, 20, None],
+            'min_samples_leaf': [1, 2, 4],
+            'min_samples_split': [2, 5]
+        },
+    },
+    'histgradientboosting': {
+        'nome': 'Histogram Gradient Boosting',
+        'classificador': lambda: HistGradientBoostingClassifier(random_state=42),
+        'regressor': lambda: HistGradientBoostingRegressor(random_state=42),
+        'param_grid': {
+            'learning_rate': [0.05, 0.1],
+            'max_iter': [100, 200],
+            'max_depth': [3, 6, None],
+            'min_samples_leaf': [20, 50]
+        },
+    },
+    'linear': {
+        'nome': 'Regressão Logística / Linear',
+        'classificador': lambda: LogisticRegression(max_iter=1000),
+        'regressor': lambda: LinearRegression(),
+        'param_grid': {
+            'C': [0.01, 0.1, 1, 10]
+        },
+    },
+}
+
+backend_padrao = 'randomforest'
+
+# cria um modelo novo (nao treinado) do backend escolhido
+# `tipo` deve ser 'classificador' ou 'regressor'
+def criar_modelo(backend, tipo):
+    if backend not in backends:
+        raise ValueError(f"Backend '{backend}' desconhecido. Opções: {', '.join(backends)}.")
+    return backends[backend][tipo]()
+
+# nome do arquivo onde o classificador treinado de cada backend e salvo
+def arquivo_modelo(backend):
+    return f"modelo_{backend}.pkl"
+
+# cada backend salva o scaler junto com o modelo, assim retreinar um backend nao altera os outros
+# o Random Forest mantem o nome antigo ('scaler.pkl'), assim como o do modelo
+def arquivo_scaler(backend):
+    if backend == 'randomforest':
+        return "scaler.pkl"
+    return f"scaler_{backend}.pkl"
+
+
+# Estatisticas principais usadas na previsao de jogos
+stats = [
+    'PTS', 'AST', 'REB', 'STL', 'BLK', 'TOV',
+    'FG_PCT', 'FG3_PCT', 'FT_PCT', 'PLUS_MINUS'
+]
+stats_avg = [f'{s}_avg' for s in stats] + ['DIAS_DESCANSO', 'WINSTREAK_anterior']
+
+def calcular_features_avancadas(df):
+    df_features = df.copy()
+
+    # Janela de 10 jogos
+    window_size = 10 
+    
+    # Calculo da media movel de cada estatistica
+    for stat in stats:
+        df_features[f'{stat}_avg'] = df_features.groupby('TEAM_NAME')[stat].transform(
+            lambda x: x.shift(1).rolling(window=window_size).mean()
+        )
+
+    # Calculo de dias de descanso
+    df_features['DIAS_DESCANSO'] = df_features.groupby('TEAM_NAME')['GAME_DATE'].diff().dt.days
+
+    # Calculo da sequencia de vitorias
+    df_features['WL_numeric'] = df_features['WL'].apply(lambda x: 1 if x == 'W' else 0)
+    derrota_streak_id = (df_features.groupby('TEAM_NAME')['WL_numeric'].shift(1) != df_features['WL_numeric']).cumsum()
+    df_features['WINSTREAK'] = df_features.groupby(['TEAM_NAME', derrota_streak_id])['WL_numeric'].cumsum()
+    df_features['WINSTREAK_anterior'] = df_features.groupby('TEAM_NAME')['WINSTREAK'].shift(1).fillna(0)
+
+    # Remove linhas onde as medias moveis nao puderam ser calculadas.
+    df_features.dropna(inplace=True)
+    return df_features
+
+# Monta uma linha por jogo (casa vs. visitante) com a diferenca entre as features dos dois times
+def montar_jogos(df_com_features):
+    # Separa os jogos em "time da casa" e "time visitante"
+    home = df_com_features[df_com_features['MATCHUP'].str.contains('vs')].copy()
+    away = df_com_features[df_com_features['MATCHUP'].str.contains('@')].copy()
+
+    # Junta os dados para criar uma linha por jogo, com as estatisticas de ambos os times.
+    games = pd.merge(home, away, on='GAME_ID', suffixes=('_home', '_away'))
+    # Define o alvo: 1 se o time da casa venceu, 0 se perdeu.
+    games['VENCEDOR'] = games['WL_home'].apply(lambda x: 1 if x == 'W' else 0)
+
+    # O modelo aprende melhor com a diferença entre os times.
+    features_finais = []
+    for stat in stats_avg:
+        diff_col = f'{stat}_diff'
+        games[diff_col] = games[f'{stat}_home'] - games[f'{stat}_away']
+        features_finais.append(diff_col)
+
+    return games[features_finais], games['VENCEDOR']
@@ -3,6 +3,7 @@ import pandas as pd
 import time
 
 import analises
+import modelos
 
 # configuracao da pagina
 st.set_page_config(
@@ -21,6 +22,20 @@ def carregar_dados(caminho):
     except FileNotFoundError:
         return None
 
+# O indice de similaridade e carregado do disco; se nao existir ou tiver sido construido com outros dados, e reconstruido e salvo.
+@st.cache_resource
+def carregar_indice(_df):
+    indice = analises.carregar_indice_similaridade()
+    if indice is None or not analises.indice_atualizado(indice, _df):
+        indice = analises.construir_indice_similaridade(_df)
+        analises.salvar_indice_similaridade(indice)
+    return indice
+
+# O regressor da previsao de pontos e treinado uma unica vez por backend e reaproveitado nas proximas consultas.
+@st.cache_resource
+def carregar_modelo_pontos(_df, backend):
+    return analises.treinar_modelo_previsao_pontos(_df, backend)
+
 # carrega os dados
 df_dados = carregar_dados('dados_limpos.pkl')
 
@@ -49,6 +64,7 @@ tipo_analise = st.sidebar.selectbox(
         "Curva da Carreira (Pontos)",
         "Desempenhos Anômalos (Jogos)",
         "Previsão para Próxima Temporada",
+        "Temporadas Similares",
     ]
 )
 
@@ -80,9 +96,15 @@ elif tipo_analise == "Desempenhos Anômalos (Jogos)":
 
 elif tipo_analise == "Previsão para Próxima Temporada":
     st.header(f"🔮 Previsão de Pontos para {jogador_selecionado}")
-    st.markdown("Usando um modelo de *Random Forest* treinado com dados de todas as temporadas para prever a média de pontos da próxima temporada.")
+    backend = st.selectbox(
+        "Modelo de previsão:",
+        options=list(modelos.backends),
+        format_func=lambda b: modelos.backends[b]['nome']
+    )
+    st.markdown(f"Usando um modelo de *{modelos.backends[backend]['nome']}* treinado com dados de todas as temporadas para prever a média de pontos da próxima temporada.")
     with st.spinner(f'Calculando previsão para {jogador_selecionado}...'):
-        resultado, erro = analises.prever_proxima_temporada(df_dados, jogador_selecionado)
+        modelo_pontos = carregar_modelo_pontos(df_dados, backend)
+        resultado, erro = analises.prever_proxima_temporada(df_dados, jogador_selecionado, backend, modelo_pontos)
         if erro:
             st.error(erro)
         else:
@@ -95,3 +117,24 @@ elif tipo_analise == "Previsão para Próxima Temporada":
                 label=f"🔥 Previsão para {resultado['temporada_previsao']}",
                 value=f"{resultado['pts_previstos']:.1f} PPG"
             )
+
+elif tipo_analise == "Temporadas Similares":
+    st.header(f"👥 Temporadas Similares às de {jogador_selecionado}")
+    st.markdown("Busca, entre todos os jogadores, as temporadas com estatísticas mais parecidas usando uma *KD-Tree* sobre os dados padronizados, e mostra a média de pontos que cada um teve na temporada seguinte (apenas temporadas com temporada seguinte registrada entram na comparação).")
+    with st.spinner('Carregando o índice de temporadas...'):
+        indice = carregar_indice(df_dados)
+
+    temporadas_indice = indice['temporadas']
+    temporadas_jogador = sorted(temporadas_indice[temporadas_indice['player_name'] == jogador_selecionado]['season_year'].unique(), reverse=True)
+    col1, col2 = st.columns(2)
+    temporada_selecionada = col1.selectbox("Temporada de referência:", options=temporadas_jogador)
+    k = col2.slider("Quantidade de temporadas similares:", min_value=1, max_value=20, value=5)
+
+    inicio = time.perf_counter()
+    df_similares, erro = analises.buscar_temporadas_similares(indice, jogador_selecionado, temporada_selecionada, k)
+    duracao_ms = (time.perf_counter() - inicio) * 1000
+    if erro:
+        st.error(erro)
+    else:
+        st.dataframe(df_similares.rename(columns={'next_pts': 'pts_temporada_seguinte'}))
+        st.caption(f"Consulta realizada em {duracao_ms:.1f} ms.")
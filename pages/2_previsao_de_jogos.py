@@ -2,6 +2,9 @@ import streamlit as st
 import pandas as pd
 import joblib
 import numpy as np
+import os
+
+import modelos
 
 # Configuracao da pagina
 st.set_page_config(page_title="Previsão de Jogos", page_icon="🔮", layout="wide")
@@ -9,13 +12,24 @@ st.title("🔮 Previsão de Jogos da NBA")
 st.write("Escolha dois times e veja quem tem mais chances de vencer com base em um modelo de Machine Learning otimizado!")
 
 
+# Backends que ja foram treinados pelo script '2_treinar_modelo_previsao.py'
+backends_treinados = [
+    b for b in modelos.backends
+    if os.path.exists(modelos.arquivo_modelo(b)) and os.path.exists(modelos.arquivo_scaler(b))
+]
+backend = st.sidebar.selectbox(
+    "Modelo de previsão",
+    options=backends_treinados or [modelos.backend_padrao],
+    format_func=lambda b: modelos.backends[b]['nome']
+)
+
 # Carrega modelo e dados
 @st.cache_data
-def carregar_recursos():
-    """ Carrega o modelo, o scaler e o dataset principal. """
+def carregar_recursos(backend):
+    """ Carrega o modelo e o scaler do backend escolhido e o dataset principal. """
     try:
-        modelo = joblib.load("modelo_randomforest.pkl")
-        scaler = joblib.load("scaler.pkl")
+        modelo = joblib.load(modelos.arquivo_modelo(backend))
+        scaler = joblib.load(modelos.arquivo_scaler(backend))
         df = pd.read_pickle('dados_completos.pkl')
         df['GAME_DATE'] = pd.to_datetime(df['GAME_DATE'])
         df = df.sort_values(by='GAME_DATE').reset_index(drop=True)
@@ -23,35 +37,13 @@ def carregar_recursos():
     except FileNotFoundError:
         return None, None, None
 
-modelo, scaler, df = carregar_recursos()
-
-# Lista de estatisticas usadas no treinamento 
-stats = [
-    'PTS', 'AST', 'REB', 'STL', 'BLK', 'TOV',
-    'FG_PCT', 'FG3_PCT', 'FT_PCT', 'PLUS_MINUS'
-]
+modelo, scaler, df = carregar_recursos(backend)
 
 # Preparacao dos dados
 @st.cache_data
 def preparar_dados_com_features(df_original):
     print("Executando engenharia de features (cache)...")
-    df_features = df_original.copy()
-    window_size = 10 
-    
-    for stat in stats:
-        df_features[f'{stat}_avg'] = df_features.groupby('TEAM_NAME')[stat].transform(
-            lambda x: x.shift(1).rolling(window=window_size).mean()
-        )
-
-    df_features['DIAS_DESCANSO'] = df_features.groupby('TEAM_NAME')['GAME_DATE'].diff().dt.days
-    
-    df_features['WL_numeric'] = df_features['WL'].apply(lambda x: 1 if x == 'W' else 0)
-    derrota_streak_id = (df_features.groupby('TEAM_NAME')['WL_numeric'].shift(1) != df_features['WL_numeric']).cumsum()
-    df_features['WINSTREAK'] = df_features.groupby(['TEAM_NAME', derrota_streak_id])['WL_numeric'].cumsum()
-    df_features['WINSTREAK_anterior'] = df_features.groupby('TEAM_NAME')['WINSTREAK'].shift(1).fillna(0)
-
-    df_features.dropna(inplace=True)
-    return df_features
+    return modelos.calcular_features_avancadas(df_original)
 
 # Interface
 if modelo is None or scaler is None or df is None:
@@ -81,7 +73,7 @@ else:
 
             
                 dados_para_prever_dict = {}
-                stats_avg = [f'{s}_avg' for s in stats] + ['DIAS_DESCANSO', 'WINSTREAK_anterior']
+                stats_avg = modelos.stats_avg
 
                 for stat in stats_avg:
                     diff_col_name = f'{stat}_diff'
@@ -0,0 +1,24 @@
+import os
+import sys
+import pandas as pd
+
+# permite importar o modulo `analises` que fica na raiz do projeto
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import analises
+
+def construir_e_salvar_indice():
+
+    print("Iniciando a construcao do indice de temporadas similares...")
+
+    try:
+        df = pd.read_pickle('dados_limpos.pkl')
+    except FileNotFoundError:
+        print("ERRO: Arquivo 'dados_limpos.pkl' não encontrado. Execute o script '0_preparar_dados_jogadores.py' primeiro.")
+        return
+
+    indice = analises.construir_indice_similaridade(df)
+    analises.salvar_indice_similaridade(indice)
+    print(f"Indice com {len(indice['temporadas'])} temporadas salvo em '{analises.arquivo_indice_similaridade}'.")
+
+if __name__ == "__main__":
+    construir_e_salvar_indice()
@@ -0,0 +1,141 @@
+import argparse
+import io
+import os
+import sys
+import time
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.metrics import accuracy_score, mean_absolute_error
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
+
+# permite importar os modulos `analises` e `modelos` que ficam na raiz do projeto
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import analises
+import modelos
+
+
+# Mede o tempo mediano (em ms) de varias chamadas de `funcao`
+def medir_latencia(funcao, repeticoes):
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return float(np.median(tempos))
+
+# Mede latencia e qualidade de um modelo ja treinado no conjunto de teste
+def medir_modelo(modelo, tipo, X_test, y_test, repeticoes):
+    uma_linha = X_test[:1]
+    latencia_linha = medir_latencia(lambda: modelo.predict(uma_linha), repeticoes)
+    latencia_lote = medir_latencia(lambda: modelo.predict(X_test), max(1, repeticoes // 10))
+
+    y_pred = modelo.predict(X_test)
+    if tipo == 'classificador':
+        metrica = {"acuracia": accuracy_score(y_test, y_pred)}
+    else:
+        metrica = {"mae": mean_absolute_error(y_test, y_pred)}
+
+    return {
+        "latencia_1_linha_ms": latencia_linha,
+        f"latencia_lote_{len(X_test)}_ms": latencia_lote,
+        **metrica,
+    }
+
+# Linha de referencia: treina o backend com os parametros padrao (sem GridSearch)
+def avaliar_backend_padrao(backend, tipo, X_train, X_test, y_train, y_test, repeticoes):
+    modelo = modelos.criar_modelo(backend, tipo)
+
+    inicio = time.perf_counter()
+    modelo.fit(X_train, y_train)
+    tempo_treino = time.perf_counter() - inicio
+
+    # Tamanho que o modelo teria salvo com joblib
+    buffer = io.BytesIO()
+    joblib.dump(modelo, buffer)
+    tamanho_kb = buffer.getbuffer().nbytes / 1024
+
+    return {
+        "backend": modelos.backends[backend]['nome'],
+        "versao": "padrão",
+        "treino_s": tempo_treino,
+        "tamanho_kb": tamanho_kb,
+        **medir_modelo(modelo, tipo, X_test, y_test, repeticoes),
+    }
+
+# Modelo realmente usado pela pagina: o `modelo_<backend>.pkl` salvo por '2_treinar_modelo_previsao.py'
+def avaliar_backend_treinado(backend, X_test_bruto, y_test, repeticoes):
+    arquivo_modelo = modelos.arquivo_modelo(backend)
+    arquivo_scaler = modelos.arquivo_scaler(backend)
+    if not (os.path.exists(arquivo_modelo) and os.path.exists(arquivo_scaler)):
+        return None
+
+    modelo = joblib.load(arquivo_modelo)
+    X_test = joblib.load(arquivo_scaler).transform(X_test_bruto)
+
+    return {
+        "backend": modelos.backends[backend]['nome'],
+        "versao": f"treinado ({arquivo_modelo})",
+        "treino_s": np.nan, # o tempo do GridSearch nao e medido aqui
+        "tamanho_kb": os.path.getsize(arquivo_modelo) / 1024,
+        **medir_modelo(modelo, 'classificador', X_test, y_test, repeticoes),
+    }
+
+# Mesmos dados e divisao usados em '2_treinar_modelo_previsao.py'
+# retorna tambem o X de teste sem normalizacao, para aplicar o scaler salvo de cada backend
+def dados_previsao_jogos():
+    df = pd.read_pickle('dados_completos.pkl')
+    df['GAME_DATE'] = pd.to_datetime(df['GAME_DATE'])
+    df = df.sort_values(by='GAME_DATE').reset_index(drop=True)
+
+    X, y = modelos.montar_jogos(modelos.calcular_features_avancadas(df))
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, shuffle=False)
+
+    scaler = StandardScaler()
+    return scaler.fit_transform(X_train), scaler.transform(X_test), y_train, y_test, X_test
+
+# Mesma base usada por `analises.prever_proxima_temporada`, separada por temporada (treino no passado, teste no futuro)
+# o regressor e treinado na hora pela pagina, entao nao existe versao salva para comparar
+def dados_previsao_pontos():
+    df = pd.read_pickle('dados_limpos.pkl')
+    df_modelo = analises.preparar_base_previsao_pontos(analises.agregar_temporadas(df))
+    df_modelo = df_modelo.sort_values(by='season_year_numeric')
+
+    X = df_modelo[analises.features_previsao_pontos]
+    y = df_modelo['next_pts']
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, shuffle=False)
+    return X_train, X_test, y_train, y_test, None
+
+def executar_benchmark():
+    parser = argparse.ArgumentParser(description="Compara os backends de modelo em tempo de treino, tamanho, latência e qualidade.")
+    parser.add_argument('--backends', nargs='+', choices=list(modelos.backends), default=list(modelos.backends))
+    parser.add_argument('--repeticoes', type=int, default=200, help="Quantidade de previsões usadas para medir a latência.")
+    args = parser.parse_args()
+
+    print("Iniciando o benchmark dos modelos...")
+    print("'padrão' = parâmetros padrão de cada backend, sem GridSearch; 'treinado' = modelo salvo usado pela página.")
+
+    tarefas = [
+        ("classificador", "Previsão de Jogos", 'dados_completos.pkl', dados_previsao_jogos),
+        ("regressor", "Previsão de Pontos", 'dados_limpos.pkl', dados_previsao_pontos),
+    ]
+    for tipo, titulo, arquivo, carregar in tarefas:
+        try:
+            X_train, X_test, y_train, y_test, X_test_bruto = carregar()
+        except FileNotFoundError:
+            print(f"\nAVISO: Arquivo '{arquivo}' não encontrado, pulando '{titulo}'.")
+            continue
+
+        print(f"\n=== {titulo} ({len(X_train)} linhas de treino, {len(X_test)} de teste) ===")
+        resultados = []
+        for backend in args.backends:
+            resultados.append(avaliar_backend_padrao(backend, tipo, X_train, X_test, y_train, y_test, args.repeticoes))
+            if X_test_bruto is not None:
+                resultado_treinado = avaliar_backend_treinado(backend, X_test_bruto, y_test, args.repeticoes)
+                if resultado_treinado is not None:
+                    resultados.append(resultado_treinado)
+        print(pd.DataFrame(resultados).set_index(["backend", "versao"]).round(4).to_string())
+
+if __name__ == "__main__":
+    executar_benchmark()